@@ -1,10 +1,99 @@
 import os
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                              QLineEdit, QPushButton, QTreeView, QFileSystemModel,
-                             QDialogButtonBox)
-from PyQt5.QtCore import Qt, QDir
+                             QDialogButtonBox, QFileIconProvider, QMessageBox)
+from PyQt5.QtCore import Qt, QDir, QFileInfo, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt5.QtGui import QFont
 
+# Parsed once per process and shared by every dialog instance
+_DIALOG_QSS = """
+    QDialog {
+        background-color: #ECECEC;
+    }
+    QLabel {
+        color: #2C3E50;
+        font-weight: bold;
+    }
+    QLineEdit {
+        padding: 8px;
+        border-radius: 4px;
+        border: 1px solid #BDC3C7;
+        background-color: #FFFFFF;
+    }
+    QTreeView {
+        background-color: #FFFFFF;
+        border-radius: 4px;
+        border: 1px solid #BDC3C7;
+        selection-background-color: #3498DB;
+    }
+    QPushButton {
+        background-color: #3498DB;
+        color: white;
+        border-radius: 4px;
+        padding: 8px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #2980B9;
+    }
+    QPushButton:pressed {
+        background-color: #1F618D;
+    }
+    QDialogButtonBox > QPushButton {
+        min-width: 80px;
+    }
+"""
+
+class FsWorkerSignals(QObject):
+    """Signals emitted by FsWorker back on the GUI thread"""
+    finished = pyqtSignal(str)
+    failed = pyqtSignal(str, str)
+
+
+class FsWorker(QRunnable):
+    """Create a folder on a pool thread so slow filesystems don't block the UI"""
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self.signals = FsWorkerSignals()
+    
+    def run(self):
+        try:
+            os.makedirs(self.path, exist_ok=True)
+        except Exception as e:
+            self.signals.failed.emit(self.path, str(e))
+        else:
+            self.signals.finished.emit(self.path)
+
+
+class NameOnlyFileSystemModel(QFileSystemModel):
+    """QFileSystemModel exposing only the name column
+
+    Size, type and date are never shown, so views get a single column
+    instead of hiding the other three one by one.
+    """
+    def columnCount(self, parent=None):
+        return 1
+
+
+class SharedIconProvider(QFileIconProvider):
+    """Icon provider handing out one folder icon and one file icon
+    
+    Every lick looks the same in the tree, so per-entry icon lookups through
+    the platform (which may touch the file on synced folders) are skipped.
+    """
+    def __init__(self):
+        super().__init__()
+        self.setOptions(QFileIconProvider.DontUseCustomDirectoryIcons)
+        self._folder_icon = super().icon(QFileIconProvider.Folder)
+        self._file_icon = super().icon(QFileIconProvider.File)
+    
+    def icon(self, info):
+        if isinstance(info, QFileInfo):
+            return self._folder_icon if info.isDir() else self._file_icon
+        return super().icon(info)
+
+
 class CreateLickDialog(QDialog):
     def __init__(self, base_dir, parent=None):
         super().__init__(parent)
@@ -14,44 +103,15 @@ class CreateLickDialog(QDialog):
         self.setMinimumWidth(500)
         self.setMinimumHeight(400)
         
+        # "Create New Folder" sub-dialog, built on first use
+        self._new_folder_dialog = None
+        self._new_folder_input = None
+        
+        # Model rooting is deferred until the dialog is first shown
+        self._ui_finalized = False
+        
         # Set dialog style
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #ECECEC;
-            }
-            QLabel {
-                color: #2C3E50;
-                font-weight: bold;
-            }
-            QLineEdit {
-                padding: 8px;
-                border-radius: 4px;
-                border: 1px solid #BDC3C7;
-                background-color: #FFFFFF;
-            }
-            QTreeView {
-                background-color: #FFFFFF;
-                border-radius: 4px;
-                border: 1px solid #BDC3C7;
-                selection-background-color: #3498DB;
-            }
-            QPushButton {
-                background-color: #3498DB;
-                color: white;
-                border-radius: 4px;
-                padding: 8px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #2980B9;
-            }
-            QPushButton:pressed {
-                background-color: #1F618D;
-            }
-            QDialogButtonBox > QPushButton {
-                min-width: 80px;
-            }
-        """)
+        self.setStyleSheet(_DIALOG_QSS)
         
         self.init_ui()
     
@@ -85,82 +145,131 @@ class CreateLickDialog(QDialog):
         # Folder tree view
         self.folder_view = QTreeView()
         self.folder_view.setMinimumHeight(200)
-        self.file_model = QFileSystemModel()
-        self.file_model.setRootPath(self.base_dir)
+        self.folder_view.setUniformRowHeights(True)  # Skip per-row size hint queries
+        self.folder_view.setAnimated(False)
+        self.folder_view.setExpandsOnDoubleClick(False)
+        self.folder_view.setItemsExpandable(True)
+        self.folder_view.setTextElideMode(Qt.ElideRight)
+        self.file_model = NameOnlyFileSystemModel()
         self.file_model.setFilter(QDir.Dirs | QDir.NoDotAndDotDot)
-        
+        self.file_model.setNameFilters([])  # Folders only, no glob matching per entry
+        self.file_model.setNameFilterDisables(False)
+
+        # Avoid per-entry metadata work (watchers, symlink resolution and
+        # custom icon lookups) which stalls the dialog on slow filesystems
+        self.file_model.setOption(QFileSystemModel.DontWatchForChanges, True)
+        self.file_model.setOption(QFileSystemModel.DontResolveSymlinks, True)
+        self._icon_provider = SharedIconProvider()  # Model does not take ownership
+        self.file_model.setIconProvider(self._icon_provider)
+
+        # Attach the view now; the model starts enumerating in showEvent
         self.folder_view.setModel(self.file_model)
-        self.folder_view.setRootIndex(self.file_model.index(self.base_dir))
+        # Prefix in the model's own path format, used to derive relative paths cheaply
+        model_path = QDir.cleanPath(QDir.fromNativeSeparators(os.path.abspath(self.base_dir)))
+        self._base_dir_prefix = model_path.rstrip("/") + "/"
         self.folder_view.clicked.connect(self.on_folder_selected)
-        self.folder_view.setColumnWidth(0, 250)
-        self.folder_view.hideColumn(1)  # Size column
-        self.folder_view.hideColumn(2)  # Type column
-        self.folder_view.hideColumn(3)  # Date modified column
         
         layout.addWidget(self.folder_view)
         
         # Selected path display
-        self.path_label = QLabel(f"Selected: {os.path.relpath(self.base_dir, self.base_dir)}")
+        self.path_label = QLabel(f"Selected: {self._relative_path(self.base_dir)}")
         self.path_label.setStyleSheet("font-style: italic; font-weight: normal; color: #7F8C8D;")
         layout.addWidget(self.path_label)
         
         # Create new folder button
-        new_folder_btn = QPushButton("Create New Folder")
-        new_folder_btn.clicked.connect(self.create_new_folder)
-        layout.addWidget(new_folder_btn)
+        self.new_folder_btn = QPushButton("Create New Folder")
+        self.new_folder_btn.clicked.connect(self.create_new_folder)
+        layout.addWidget(self.new_folder_btn)
         
         # Dialog buttons
         button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         button_box.accepted.connect(self.accept)
         button_box.rejected.connect(self.reject)
+        self._ok_button = button_box.button(QDialogButtonBox.Ok)
         layout.addWidget(button_box)
     
+    def showEvent(self, event):
+        """Root the folder model the first time the dialog becomes visible"""
+        if not self._ui_finalized:
+            self._ui_finalized = True
+            self.file_model.setRootPath(self.base_dir)
+            self.folder_view.setRootIndex(self.file_model.index(self.base_dir))
+            self.folder_view.setColumnWidth(0, 250)
+        super().showEvent(event)
+    
+    def _relative_path(self, path):
+        """Return path relative to the base folder, avoiding os.path.relpath for model paths"""
+        if path.startswith(self._base_dir_prefix):
+            return path[len(self._base_dir_prefix):] or "."
+        return os.path.relpath(path, self.base_dir)
+    
     def on_folder_selected(self, index):
         """Handle folder selection in the tree view"""
-        self.selected_dir = self.file_model.filePath(index)
-        rel_path = os.path.relpath(self.selected_dir, self.base_dir)
-        self.path_label.setText(f"Selected: {rel_path}")
+        selected_dir = self.file_model.filePath(index)
+        if selected_dir == self.selected_dir:
+            return  # Repeat click on the same row
+        self.selected_dir = selected_dir
+        self.path_label.setText(f"Selected: {self._relative_path(selected_dir)}")
+    
+    def _ensure_new_folder_dialog(self):
+        """Build the "Create New Folder" sub-dialog on first use and reuse it afterwards"""
+        if self._new_folder_dialog is None:
+            dialog = QDialog(self)
+            dialog.setWindowTitle("Create New Folder")  # Inherits this dialog's stylesheet
+            dialog_layout = QVBoxLayout(dialog)
+            dialog_layout.setContentsMargins(20, 20, 20, 20)
+            
+            # Folder name input
+            name_layout = QHBoxLayout()
+            name_layout.addWidget(QLabel("Folder Name:"))
+            self._new_folder_input = QLineEdit()
+            self._new_folder_input.setPlaceholderText("Enter folder name...")
+            name_layout.addWidget(self._new_folder_input)
+            dialog_layout.addLayout(name_layout)
+            
+            # Buttons
+            button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+            button_box.accepted.connect(dialog.accept)
+            button_box.rejected.connect(dialog.reject)
+            dialog_layout.addWidget(button_box)
+            
+            self._new_folder_dialog = dialog
+        
+        self._new_folder_input.clear()
+        return self._new_folder_dialog
     
     def create_new_folder(self):
         """Create a new subfolder in the selected directory"""
         if not self.selected_dir:
             return
             
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Create New Folder")
-        dialog.setStyleSheet(self.styleSheet())
-        dialog_layout = QVBoxLayout(dialog)
-        dialog_layout.setContentsMargins(20, 20, 20, 20)
-        
-        # Folder name input
-        name_layout = QHBoxLayout()
-        name_layout.addWidget(QLabel("Folder Name:"))
-        folder_name_input = QLineEdit()
-        folder_name_input.setPlaceholderText("Enter folder name...")
-        name_layout.addWidget(folder_name_input)
-        dialog_layout.addLayout(name_layout)
-        
-        # Buttons
-        button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        button_box.accepted.connect(dialog.accept)
-        button_box.rejected.connect(dialog.reject)
-        dialog_layout.addWidget(button_box)
-        
+        dialog = self._ensure_new_folder_dialog()
         if dialog.exec_():
-            folder_name = folder_name_input.text().strip()
+            folder_name = self._new_folder_input.text().strip()
             if folder_name:
                 new_folder_path = os.path.join(self.selected_dir, folder_name)
-                try:
-                    os.makedirs(new_folder_path, exist_ok=True)
-                    # Update tree view to show new folder
-                    self.folder_view.setCurrentIndex(
-                        self.file_model.index(new_folder_path)
-                    )
-                    self.selected_dir = new_folder_path
-                    rel_path = os.path.relpath(self.selected_dir, self.base_dir)
-                    self.path_label.setText(f"Selected: {rel_path}")
-                except Exception as e:
-                    print(f"Error creating folder: {e}")
+                worker = FsWorker(new_folder_path)
+                worker.signals.finished.connect(self.on_folder_created)
+                worker.signals.failed.connect(self.on_folder_failed)
+                # Accepting now would file the lick under the previous folder
+                self.new_folder_btn.setEnabled(False)
+                self._ok_button.setEnabled(False)
+                QThreadPool.globalInstance().start(worker)
+    
+    def on_folder_created(self, path):
+        """Select a folder once the worker has created it"""
+        self.new_folder_btn.setEnabled(True)
+        self._ok_button.setEnabled(True)
+        # Update tree view to show new folder
+        self.folder_view.setCurrentIndex(self.file_model.index(path))
+        self.selected_dir = path
+        self.path_label.setText(f"Selected: {self._relative_path(path)}")
+    
+    def on_folder_failed(self, path, error):
+        """Report a folder the worker could not create"""
+        self.new_folder_btn.setEnabled(True)
+        self._ok_button.setEnabled(True)
+        QMessageBox.warning(self, "Error Creating Folder", f"Could not create folder: {error}")
     
     def get_lick_info(self):
         """Return the lick name and path"""
@@ -1,40 +1,200 @@
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, 
+from PyQt5.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, 
                              QScrollArea, QFrame, QGraphicsView, QGraphicsScene, 
-                             QGraphicsItem, QGraphicsTextItem, QGraphicsLineItem,
-                             QGraphicsEllipseItem)
-from PyQt5.QtCore import Qt, QRectF, QPointF, QMimeData, pyqtSignal
-from PyQt5.QtGui import QPen, QFont, QColor, QBrush, QPainter, QDragEnterEvent, QDropEvent, QDrag
-import json
+                             QGraphicsItem, QGraphicsEllipseItem, QGraphicsItemGroup)
+from PyQt5.QtCore import Qt, QRectF, QPointF, QLineF, QMimeData, QTimer, pyqtSignal
+from PyQt5.QtGui import (QPen, QFont, QColor, QBrush, QPainter, QDrag,
+                         QPixmap, QStaticText, QTransform)
+
+# Fixed fretboard layout shared by the view and the fret palette
+STRING_COUNT = 6
+FRET_COUNT = 12
+STRING_SPACING = 30
+FRET_SPACING = 60
+LEFT_MARGIN = 40
+TOP_MARGIN = 40
+
+# Mime texts of the technique buttons: slide, hammer-on and pull-off
+_TECHNIQUES = frozenset(("/", "h", "p"))
+
+# Stylesheets are module constants so each string is built once per process
+_TECH_BTN_QSS = """
+    QPushButton {
+        background-color: #E74C3C;
+        color: white;
+        border-radius: 5px;
+        font-weight: bold;
+        padding: 8px;
+    }
+    QPushButton:hover {
+        background-color: #C0392B;
+    }
+    QPushButton:pressed {
+        background-color: #922B21;
+    }
+"""
+
+_NAV_BTN_QSS = """
+    QPushButton {
+        background-color: #27AE60;
+        color: white;
+        border-radius: 5px;
+        padding: 8px;
+    }
+    QPushButton:hover {
+        background-color: #229954;
+    }
+    QPushButton:pressed {
+        background-color: #1E8449;
+    }
+"""
+
+_SAVE_QSS = """
+    QPushButton {
+        background-color: #9B59B6;
+        color: white;
+        border-radius: 5px;
+        font-weight: bold;
+        padding: 10px;
+    }
+    QPushButton:hover {
+        background-color: #8E44AD;
+    }
+    QPushButton:pressed {
+        background-color: #7D3C98;
+    }
+"""
+
+_DELETE_QSS = """
+    QPushButton {
+        background-color: #E74C3C;
+        color: white;
+        border-radius: 5px;
+        font-weight: bold;
+        padding: 10px;
+    }
+    QPushButton:hover {
+        background-color: #C0392B;
+    }
+    QPushButton:pressed {
+        background-color: #922B21;
+    }
+"""
+
+
+class Note:
+    """A single tab note; converted to and from dicts only at the file boundary"""
+    __slots__ = ("string", "fret", "technique", "extra")
+    
+    _FIELDS = frozenset(("string", "fret", "technique"))
+    
+    def __init__(self, string, fret=None, technique=None, extra=None):
+        self.string = string
+        self.fret = fret
+        self.technique = technique
+        self.extra = extra  # Keys the editor doesn't use, written back unchanged
+    
+    @classmethod
+    def from_dict(cls, data):
+        extra = {key: value for key, value in data.items() if key not in cls._FIELDS}
+        return cls(data["string"], data.get("fret"), data.get("technique"), extra or None)
+    
+    def to_dict(self):
+        data = {"string": self.string}
+        if self.fret is not None:
+            data["fret"] = self.fret
+        if self.technique is not None:
+            data["technique"] = self.technique
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+
+class NoteCircle(QGraphicsEllipseItem):
+    """Note circle that antialiases itself; the rest of the board is axis-aligned"""
+    def paint(self, painter, option, widget=None):
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        super().paint(painter, option, widget)
+        painter.setRenderHint(QPainter.Antialiasing, False)
+
+
+class StaticTextItem(QGraphicsItem):
+    """Text item painting a pre-laid-out QStaticText instead of a QTextDocument"""
+    def __init__(self, font, color, centered=False, parent=None):
+        super().__init__(parent)
+        self._font = font
+        self._pen = QPen(color)
+        self._centered = centered
+        self._margin = 0 if centered else 4  # Same inset as QGraphicsTextItem's document margin
+        self._static_text = QStaticText()
+    
+    def set_static_text(self, static_text):
+        """Swap in another cached layout"""
+        if static_text is not self._static_text:
+            self.prepareGeometryChange()
+            self._static_text = static_text
+            self.update()  # Same-size labels keep their DeviceCoordinateCache otherwise
+    
+    def boundingRect(self):
+        size = self._static_text.size()
+        if self._centered:
+            return QRectF(-size.width() / 2, -size.height() / 2, size.width(), size.height())
+        return QRectF(0, 0, size.width() + 2 * self._margin, size.height() + 2 * self._margin)
+    
+    def paint(self, painter, option, widget=None):
+        origin = self.boundingRect().topLeft() + QPointF(self._margin, self._margin)
+        painter.setFont(self._font)
+        painter.setPen(self._pen)
+        painter.drawStaticText(origin, self._static_text)
+
 
 class FretboardView(QGraphicsView):
+    # Rendered fretboard shared by every view; the geometry is identical across instances
+    _BACKGROUND_PIXMAP = None
+    
+    # String labels from the high E at the top to the low E at the bottom
+    STRING_NAMES = ("E", "B", "G", "D", "A", "E")
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.scene = QGraphicsScene(self)
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)  # A few dozen items, linear lookup beats a BSP tree
         self.setScene(self.scene)
         
         # Configure view
-        self.setRenderHint(QPainter.Antialiasing)
-        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        self.viewport().setAttribute(Qt.WA_OpaquePaintEvent)  # Background pixmap covers the viewport
+        self.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
+        self.setCacheMode(QGraphicsView.CacheBackground)  # Keep the fretboard pixmap in device memory
+        # Items set their own render hints and don't rely on leaked painter state
+        self.setOptimizationFlags(QGraphicsView.DontSavePainterState |
+                                  QGraphicsView.DontAdjustForAntialiasing)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         
         # Fretboard dimensions
-        self.string_count = 6
-        self.fret_count = 12
-        self.string_spacing = 30
-        self.fret_spacing = 60
-        self.left_margin = 40
-        self.top_margin = 40
+        self.string_count = STRING_COUNT
+        self.fret_count = FRET_COUNT
+        self.string_spacing = STRING_SPACING
+        self.fret_spacing = FRET_SPACING
+        self.left_margin = LEFT_MARGIN
+        self.top_margin = TOP_MARGIN
+        self._recompute_geometry()
         
         # Current measure and note being edited
         self.current_measure = 0
         self.measures = []
         
-        # Store references to graphics items
-        self.string_lines = []
-        self.fret_lines = []
-        self.string_labels = []
-        self.note_items = []
+        # Note items are pooled per string and reused across redraws, all parented
+        # to one contentless group so they can be dropped from the scene at once
+        self._note_items_by_string = {}
+        self._notes_group = self._create_notes_group()
+        
+        # Strings changed by drops, refreshed together at most once per frame
+        self._dirty_strings = set()
+        self._redraw_pending = False
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(16)  # ~one frame at 60 Hz
+        self._redraw_timer.timeout.connect(self._flush_redraw)
         
         # Colors
         self.background_color = QColor("#F5F5F5")  # Light gray background
@@ -45,128 +205,231 @@ class FretboardView(QGraphicsView):
         self.text_color = QColor("#FFFFFF")         # White text
         self.string_label_color = QColor("#2C3E50") # Dark blue-gray for labels
         
-        # Set background color
-        self.setBackgroundBrush(QBrush(self.background_color))
-        
-        # Draw the fretboard
-        self.draw_fretboard()
+        # Fonts, pens and brushes are shared by every draw call
+        self._string_font = QFont("Arial", 10)
+        self._note_font = QFont("Arial", 9, QFont.Bold)
+        self._tech_font = QFont("Arial", 8)
+        self._string_pen = QPen(self.string_color, 2)
+        self._fret_pen = QPen(self.fret_color, 1)
+        self._nut_pen = QPen(self.nut_color, 3)  # Thicker line for nut (first fret)
+        self._note_brush = QBrush(self.note_color)
+        self._black_pen = QPen(Qt.black, 1)
+        
+        # Pre-laid-out fret number and technique text
+        self._fret_texts = {}
+        self._tech_texts = {}
+        for fret in range(self.fret_count + 1):
+            self._static_text(self._fret_texts, str(fret), self._note_font)
         
         # Set fixed size based on fretboard dimensions
-        width = self.left_margin + (self.fret_count * self.fret_spacing) + 50
-        height = self.top_margin + ((self.string_count - 1) * self.string_spacing) + 50
+        width = self._board_right + 50
+        height = self._board_bottom + 50
         self.setFixedSize(width, height)
         
         # Adjust the scene rect to fit the fretboard
         self.scene.setSceneRect(0, 0, width, height)
         
+        # Draw the fretboard
+        self.draw_fretboard()
+        
         # Enable drag and drop
         self.setAcceptDrops(True)
         self.setDragMode(QGraphicsView.NoDrag)  # We only want to accept drops, not initiate drags
     
+    def _recompute_geometry(self):
+        """Derive lookup tables and bounds from the dimensions; called once from __init__"""
+        # Pixel centres of each string and fret slot, looked up instead of recomputed
+        self._string_y = tuple(self.top_margin + i * self.string_spacing
+                               for i in range(self.string_count))
+        self._fret_x = tuple(self.left_margin + i * self.fret_spacing - self.fret_spacing / 2
+                             for i in range(self.fret_count + 1))
+        self._inv_string_spacing = 1.0 / self.string_spacing
+        
+        # Playable area spanned by the strings and frets, also the drop zone
+        self._board_right = self.left_margin + (self.fret_count * self.fret_spacing)
+        self._board_bottom = self.top_margin + ((self.string_count - 1) * self.string_spacing)
+        self._board_rect = QRectF(self.left_margin, self.top_margin,
+                                  self._board_right - self.left_margin,
+                                  self._board_bottom - self.top_margin)
+        self._board_view_rect = None  # Viewport-space copy, mapped on first drop
+    
     def draw_fretboard(self):
-        """Draw the guitar fretboard with strings and frets"""
-        # Clear previous fretboard
-        self.clear_all_items()
-        
-        # Draw strings (horizontal lines)
-        for i in range(self.string_count):
-            y = self.top_margin + (i * self.string_spacing)
-            string_line = self.scene.addLine(
-                self.left_margin, y, 
-                self.left_margin + (self.fret_count * self.fret_spacing), y,
-                QPen(self.string_color, 2)
-            )
-            self.string_lines.append(string_line)
+        """Render the static strings, frets and labels into the background pixmap"""
+        rect = self.sceneRect()
+        ratio = self.devicePixelRatioF()
+        cached = FretboardView._BACKGROUND_PIXMAP
+        if cached is not None and cached.devicePixelRatio() == ratio:
+            self._fretboard_pixmap = cached
+            self.resetCachedContent()
+            return
+        
+        pixmap = QPixmap(int(rect.width() * ratio), int(rect.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(self.background_color)
+        
+        painter = QPainter(pixmap)
+        painter.setFont(self._string_font)
+        
+        # Draw strings (horizontal lines) in one batch
+        painter.setPen(self._string_pen)
+        painter.drawLines([QLineF(self.left_margin, y, self._board_right, y)
+                           for y in self._string_y])
+        
+        # Add string names (E, A, D, G, B, E from bottom to top)
+        painter.setPen(self.string_label_color)
+        for name, y in zip(FretboardView.STRING_NAMES, self._string_y):
+            painter.drawText(QRectF(self.left_margin - 27, y - 8, 20, 20), Qt.AlignCenter, name)
+        
+        # Draw frets (vertical lines): the thicker nut, then the rest in one batch
+        fret_lines = [QLineF(x, self.top_margin, x, self._board_bottom)
+                      for x in (self.left_margin + i * self.fret_spacing
+                                for i in range(self.fret_count + 1))]
+        painter.setPen(self._nut_pen)
+        painter.drawLine(fret_lines[0])
+        painter.setPen(self._fret_pen)
+        painter.drawLines(fret_lines[1:])
+        
+        painter.end()
+        FretboardView._BACKGROUND_PIXMAP = pixmap
+        self._fretboard_pixmap = pixmap
+        self.resetCachedContent()
+    
+    def resizeEvent(self, event):
+        self._board_view_rect = None  # The scene may now sit elsewhere in the viewport
+        super().resizeEvent(event)
+    
+    def scrollContentsBy(self, dx, dy):
+        self._board_view_rect = None
+        super().scrollContentsBy(dx, dy)
+    
+    def drawBackground(self, painter, rect):
+        """Blit the pre-rendered fretboard instead of drawing individual items"""
+        painter.drawPixmap(0, 0, self._fretboard_pixmap)
+    
+    def _create_notes_group(self):
+        """Add an empty parent item for the pooled note items"""
+        group = QGraphicsItemGroup()
+        group.setFlag(QGraphicsItem.ItemHasNoContents, True)
+        self.scene.addItem(group)
+        return group
+    
+    @staticmethod
+    def _static_text(cache, text, font):
+        """Return the cached QStaticText for a string, laying it out on first use"""
+        static_text = cache.get(text)
+        if static_text is None:
+            static_text = QStaticText(text)
+            static_text.prepare(QTransform(), font)
+            cache[text] = static_text
+        return static_text
+    
+    def _get_note_items(self, string_idx):
+        """Return the (circle, text, technique) items for a string, creating them once"""
+        items = self._note_items_by_string.get(string_idx)
+        if items is None:
+            # Create note circle with text
+            circle = NoteCircle(-10, -10, 20, 20)
+            circle.setBrush(self._note_brush)
+            circle.setPen(self._black_pen)
+            
+            # Add fret number text
+            text = StaticTextItem(self._note_font, self.text_color, centered=True)
+            
+            # Add notation for techniques
+            tech_text = StaticTextItem(self._tech_font, Qt.black)
             
-            # Add string name (E, A, D, G, B, E from bottom to top)
-            string_names = ["E", "B", "G", "D", "A", "E"]
-            string_label = self.scene.addText(string_names[i], QFont("Arial", 10))
-            string_label.setDefaultTextColor(self.string_label_color)
-            string_label.setPos(self.left_margin - 25, y - 10)
-            self.string_labels.append(string_label)
-        
-        # Draw frets (vertical lines)
-        for i in range(self.fret_count + 1):
-            x = self.left_margin + (i * self.fret_spacing)
-            pen_color = self.nut_color if i == 0 else self.fret_color
-            fret_line = self.scene.addLine(
-                x, self.top_margin, 
-                x, self.top_margin + ((self.string_count - 1) * self.string_spacing),
-                QPen(pen_color, (3 if i == 0 else 1))  # Thicker line for nut (first fret)
-            )
-            self.fret_lines.append(fret_line)
-    
-    def clear_all_items(self):
-        """Clear all graphics items from the scene"""
-        # Remove all items from the scene
-        for item in self.string_lines + self.fret_lines + self.string_labels + self.note_items:
-            if item and item.scene():
-                self.scene.removeItem(item)
-        
-        # Clear all lists
-        self.string_lines.clear()
-        self.fret_lines.clear()
-        self.string_labels.clear()
-        self.note_items.clear()
+            items = (circle, text, tech_text)
+            for item in items:
+                # Rasterize once and don't re-render glyphs when the view transform changes
+                item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+                item.setFlag(QGraphicsItem.ItemIgnoresTransformations, True)
+                item.setParentItem(self._notes_group)
+            self._note_items_by_string[string_idx] = items
+        return items
+    
+    def _show_note(self, string_idx, note):
+        """Position and show the pooled items for a string, or hide them if there is no note"""
+        fret = note.fret if note else None
+        if fret is None:
+            for item in self._note_items_by_string.get(string_idx, ()):
+                item.setVisible(False)
+            return
+        
+        circle, text, tech_text = self._get_note_items(string_idx)
+        if isinstance(string_idx, int) and 0 <= string_idx < self.string_count:
+            y = self._string_y[string_idx]
+        else:
+            # Strings from a file may lie outside the board, be negative or be floats
+            y = self.top_margin + (string_idx * self.string_spacing)
+        if isinstance(fret, int) and 0 <= fret <= self.fret_count:
+            x = self._fret_x[fret]
+        else:
+            # Frets from a file or an external drop may lie past the table or be floats
+            x = self.left_margin + (fret * self.fret_spacing) - (self.fret_spacing / 2)
+        
+        circle.setPos(x, y)
+        circle.setVisible(True)
+        
+        text.set_static_text(self._static_text(self._fret_texts, str(fret), self._note_font))
+        text.setPos(x, y)
+        text.setVisible(True)
+        
+        # Show notation for techniques if present
+        technique = note.technique
+        if technique:
+            tech_text.set_static_text(self._static_text(self._tech_texts, technique, self._tech_font))
+            tech_text.setPos(x + 15, y - 25)
+        tech_text.setVisible(bool(technique))
     
     def draw_tablature(self, measure_data):
         """Draw the tablature notes onto the fretboard"""
         if not measure_data or "notes" not in measure_data:
             return
-            
-        # Clear existing notes
-        for item in self.note_items:
-            if item and item.scene():
-                self.scene.removeItem(item)
-        self.note_items.clear()
-            
-        for note in measure_data["notes"]:
-            string_idx = note.get("string")
-            fret = note.get("fret")
-            
-            if string_idx is not None and fret is not None:
-                y = self.top_margin + (string_idx * self.string_spacing)
-                x = self.left_margin + (fret * self.fret_spacing) - (self.fret_spacing / 2)
-                
-                # Create note circle with text
-                circle = QGraphicsEllipseItem(-10, -10, 20, 20)
-                circle.setBrush(QBrush(self.note_color))
-                circle.setPen(QPen(Qt.black, 1))
-                circle.setPos(x, y)
-                self.scene.addItem(circle)
-                self.note_items.append(circle)
-                
-                # Add fret number text
-                text = QGraphicsTextItem(str(fret))
-                text.setDefaultTextColor(self.text_color)
-                text.setFont(QFont("Arial", 9, QFont.Bold))
-                # Center the text in the circle
-                text_width = text.boundingRect().width()
-                text_height = text.boundingRect().height()
-                text.setPos(x - text_width/2, y - text_height/2)
-                self.scene.addItem(text)
-                self.note_items.append(text)
-                
-                # Add notation for techniques if present
-                technique = note.get("technique")
-                if technique:
-                    tech_text = self.scene.addText(technique, QFont("Arial", 8))
-                    tech_text.setDefaultTextColor(Qt.black)
-                    tech_text.setPos(x + 15, y - 25)
-                    self.note_items.append(tech_text)
+        
+        drawn_strings = set()
+        for string_idx, note in measure_data["notes"].items():
+            if note.fret is not None:
+                self._show_note(string_idx, note)
+                drawn_strings.add(string_idx)
+        
+        # Hide items left over from strings without a note
+        for string_idx in self._note_items_by_string:
+            if string_idx not in drawn_strings:
+                self._show_note(string_idx, None)
+    
+    def _update_note_item(self, string_idx):
+        """Refresh only the items of one string from the current measure"""
+        note = None
+        if self.current_measure < len(self.measures):
+            note = self.measures[self.current_measure]["notes"].get(string_idx)
+        self._show_note(string_idx, note)
+    
+    def _schedule_redraw(self, string_idx):
+        """Mark a string as changed and queue a single refresh for the next frame"""
+        self._dirty_strings.add(string_idx)
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self._redraw_timer.start()
+    
+    def _flush_redraw(self):
+        """Refresh every string marked since the last flush"""
+        self._redraw_pending = False
+        dirty_strings, self._dirty_strings = self._dirty_strings, set()
+        for string_idx in dirty_strings:
+            self._update_note_item(string_idx)
     
     def clear_tablature(self):
         """Clear all tablature notes but keep the fretboard"""
-        # Clear only the note items
-        for item in self.note_items:
-            if item and item.scene():
-                self.scene.removeItem(item)
-        self.note_items.clear()
+        # Hide the note items so they can be reused by the next draw
+        for items in self._note_items_by_string.values():
+            for item in items:
+                item.setVisible(False)
     
     def load_measure(self, measure_index):
         """Load a specific measure into the view"""
         if 0 <= measure_index < len(self.measures):
             self.current_measure = measure_index
+            # Item changes only mark their own areas dirty, repainted together
             self.clear_tablature()
             self.draw_tablature(self.measures[measure_index])
     
@@ -182,59 +445,56 @@ class FretboardView(QGraphicsView):
     
     def dropEvent(self, event):
         """Handle drop events to add notes to the fretboard"""
+        # Reject drops well outside the board on integer viewport coordinates
+        # before mapping the point into the scene
+        if self._board_view_rect is None:
+            view_rect = self.mapFromScene(self._board_rect).boundingRect()
+            self._board_view_rect = view_rect.adjusted(-1, -1, 1, 1)  # Cover rounding at the edges
+        if not self._board_view_rect.contains(event.pos()):
+            return
+        
         pos = self.mapToScene(event.pos())
         
         # Check if within fretboard bounds
-        if (self.left_margin <= pos.x() <= self.left_margin + (self.fret_count * self.fret_spacing) and
-            self.top_margin <= pos.y() <= self.top_margin + ((self.string_count - 1) * self.string_spacing)):
+        if self._board_rect.contains(pos):
             
-            # Determine string and fret
-            string_idx = round((pos.y() - self.top_margin) / self.string_spacing)
-            fret_pos = (pos.x() - self.left_margin) / self.fret_spacing
-            fret = max(0, min(self.fret_count, round(fret_pos)))
+            # Determine string; the fret comes from the dropped text
+            string_idx = round((pos.y() - self.top_margin) * self._inv_string_spacing)
             
             # Get the dropped item text
             dropped_text = event.mimeData().text()
             
             # Check if it's a fret number or technique
-            if dropped_text.isdigit():
+            if dropped_text in _TECHNIQUES:
+                fret = None
+                technique = dropped_text
+            elif dropped_text.isdecimal():
                 fret = int(dropped_text)
                 technique = None
             else:
-                technique = dropped_text
+                return  # Not something the palettes produce
             
             # Ensure valid string
             if 0 <= string_idx < self.string_count:
                 # Add or update note to the current measure
                 if self.current_measure < len(self.measures):
-                    # Find existing note on this string
-                    existing_note_idx = -1
-                    for i, existing_note in enumerate(self.measures[self.current_measure]["notes"]):
-                        if existing_note.get("string") == string_idx:
-                            existing_note_idx = i
-                            break
+                    # Notes are keyed by string, so the existing note is a direct lookup
+                    notes = self.measures[self.current_measure]["notes"]
+                    existing_note = notes.get(string_idx)
                     
-                    if dropped_text.isdigit():
+                    if fret is not None:
                         # Adding/updating a fret number
-                        note = {"string": string_idx, "fret": fret}
-                        if existing_note_idx >= 0:
-                            # Keep technique if it exists
-                            if "technique" in self.measures[self.current_measure]["notes"][existing_note_idx]:
-                                note["technique"] = self.measures[self.current_measure]["notes"][existing_note_idx]["technique"]
-                            # Update existing note
-                            self.measures[self.current_measure]["notes"][existing_note_idx] = note
-                        else:
-                            # Add new note
-                            self.measures[self.current_measure]["notes"].append(note)
+                        # Keep technique if it exists
+                        notes[string_idx] = Note(string_idx, fret,
+                                                 existing_note.technique if existing_note else None)
                     else:
                         # Adding a technique
-                        if existing_note_idx >= 0:
+                        if existing_note:
                             # Update existing note with technique
-                            self.measures[self.current_measure]["notes"][existing_note_idx]["technique"] = technique
+                            existing_note.technique = technique
                     
-                    # Redraw tablature
-                    self.clear_tablature()
-                    self.draw_tablature(self.measures[self.current_measure])
+                    # Only the dropped string's items changed
+                    self._schedule_redraw(string_idx)
             
             event.acceptProposedAction()
 
@@ -245,30 +505,112 @@ class DraggableButton(QPushButton):
         self.mime_text = mime_text
         self.setFixedSize(40, 40)  # Make buttons square for a cleaner look
         
-        # Apply a nice style
-        self.setStyleSheet("""
-            QPushButton {
-                background-color: #3498DB;
-                color: white;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #2980B9;
-            }
-            QPushButton:pressed {
-                background-color: #1F618D;
-            }
-        """)
+        self._press_pos = None
+        self._dragging = False
+    
+    def mousePressEvent(self, event):
+        """Remember where a potential drag started"""
+        if event.button() == Qt.LeftButton:
+            self._press_pos = event.pos()
+        super().mousePressEvent(event)
     
     def mouseMoveEvent(self, event):
         """Enable drag and drop for buttons"""
-        if event.buttons() & Qt.LeftButton:
-            drag = QDrag(self)
+        if self._dragging or not (event.buttons() & Qt.LeftButton) or self._press_pos is None:
+            return
+        
+        # Ignore small jitters so a click doesn't start a drag
+        if (event.pos() - self._press_pos).manhattanLength() < QApplication.startDragDistance():
+            return
+        
+        self._dragging = True
+        try:
+            # QDrag takes ownership of its mime data, so it is built once per drag
             mime_data = QMimeData()
             mime_data.setText(self.mime_text)
+            drag = QDrag(self)
             drag.setMimeData(mime_data)
             drag.exec_(Qt.CopyAction)
+        finally:
+            self._dragging = False
+            self._press_pos = None
+            self.setDown(False)
+
+
+class FretPaletteWidget(QWidget):
+    """Single drag source painting the fret numbers as a row of buttons"""
+    cell_size = 40
+    cell_spacing = 5
+    
+    def __init__(self, fret_count, parent=None):
+        super().__init__(parent)
+        self.fret_count = fret_count
+        self.button_color = QColor("#3498DB")
+        self.text_color = QColor("#FFFFFF")
+        self.setFixedSize(fret_count * (self.cell_size + self.cell_spacing) - self.cell_spacing,
+                          self.cell_size)
+        
+        self._pixmap = None
+        self._press_pos = None
+        self._press_fret = None
+    
+    def _render_pixmap(self):
+        """Paint all of the fret buttons into one pixmap"""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(int(self.width() * ratio), int(self.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        
+        font = QFont(self.font())
+        font.setBold(True)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setFont(font)
+        for i in range(self.fret_count):
+            rect = QRectF(i * (self.cell_size + self.cell_spacing), 0, self.cell_size, self.cell_size)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(self.button_color)
+            painter.drawRoundedRect(rect, 5, 5)
+            painter.setPen(self.text_color)
+            painter.drawText(rect, Qt.AlignCenter, str(i + 1))
+        painter.end()
+        return pixmap
+    
+    def fret_at(self, x):
+        """Return the fret number under an x coordinate, or None between buttons"""
+        pitch = self.cell_size + self.cell_spacing
+        if x < 0 or x % pitch >= self.cell_size:
+            return None
+        fret = int(x // pitch) + 1
+        return fret if fret <= self.fret_count else None
+    
+    def paintEvent(self, event):
+        if self._pixmap is None:
+            self._pixmap = self._render_pixmap()
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._pixmap)
+    
+    def mousePressEvent(self, event):
+        """Remember which fret a potential drag started on"""
+        if event.button() == Qt.LeftButton:
+            self._press_pos = event.pos()
+            self._press_fret = self.fret_at(event.x())
+    
+    def mouseMoveEvent(self, event):
+        """Drag the pressed fret number onto the fretboard"""
+        if self._press_fret is None or not (event.buttons() & Qt.LeftButton):
+            return
+        
+        # Ignore small jitters so a click doesn't start a drag
+        if (event.pos() - self._press_pos).manhattanLength() < QApplication.startDragDistance():
+            return
+        
+        fret, self._press_fret = self._press_fret, None
+        mime_data = QMimeData()
+        mime_data.setText(str(fret))
+        drag = QDrag(self)
+        drag.setMimeData(mime_data)
+        drag.exec_(Qt.CopyAction)
 
 
 class LickEditor(QWidget):
@@ -282,12 +624,42 @@ class LickEditor(QWidget):
         # Set background color
         self.setStyleSheet("background-color: #ECECEC;")
         
+        # Last text pushed to the measure label, to skip identical updates
+        self._last_measure_label = None
+        
         self.init_ui()
         
         # Data structure for the lick
         self.lick_data = {
             "name": "New Lick",
-            "measures": [{"notes": []}]  # Start with one empty measure
+            "measures": [{"notes": {}}]  # Start with one empty measure
+        }
+    
+    @staticmethod
+    def _migrate_measure(measure):
+        """Convert a measure's note list into the string-indexed Note dict used by the fretboard"""
+        notes = measure.get("notes") or []
+        if isinstance(notes, dict):
+            notes = notes.values()
+        
+        migrated = dict(measure)
+        migrated["notes"] = {
+            note["string"]: Note.from_dict(note) for note in notes if note.get("string") is not None
+        }
+        return migrated
+    
+    @staticmethod
+    def _serialize_measure(measure):
+        """Convert a measure back to the list-of-notes format stored in .lick files"""
+        serialized = dict(measure)
+        serialized["notes"] = [note.to_dict() for note in measure["notes"].values()]
+        return serialized
+    
+    def get_lick_data(self):
+        """Return the current lick in its on-disk format"""
+        return {
+            "name": self.title_label.text(),
+            "measures": [self._serialize_measure(m) for m in self.fretboard.measures]
         }
     
     def init_ui(self):
@@ -312,11 +684,7 @@ class LickEditor(QWidget):
         
         fret_button_widget = QWidget()
         fret_grid = QHBoxLayout(fret_button_widget)
-        fret_grid.setSpacing(5)
-        
-        for i in range(1, 13):  # Frets 1-12
-            btn = DraggableButton(str(i), str(i))
-            fret_grid.addWidget(btn)
+        fret_grid.addWidget(FretPaletteWidget(FRET_COUNT))  # Frets 1-12
         
         fret_buttons_layout.addWidget(fret_button_widget)
         fret_buttons_layout.addStretch()
@@ -330,33 +698,17 @@ class LickEditor(QWidget):
         technique_layout = QHBoxLayout()
         technique_layout.addWidget(QLabel("Techniques:"))
         
-        # Style for technique buttons
-        technique_style = """
-            QPushButton {
-                background-color: #E74C3C;
-                color: white;
-                border-radius: 5px;
-                font-weight: bold;
-                padding: 8px;
-            }
-            QPushButton:hover {
-                background-color: #C0392B;
-            }
-            QPushButton:pressed {
-                background-color: #922B21;
-            }
-        """
         
         self.slide_btn = DraggableButton("Slide", "/")
-        self.slide_btn.setStyleSheet(technique_style)
+        self.slide_btn.setStyleSheet(_TECH_BTN_QSS)
         self.slide_btn.setFixedWidth(80)
         
         self.hammer_btn = DraggableButton("Hammer-on", "h")
-        self.hammer_btn.setStyleSheet(technique_style)
+        self.hammer_btn.setStyleSheet(_TECH_BTN_QSS)
         self.hammer_btn.setFixedWidth(80)
         
         self.pull_btn = DraggableButton("Pull-off", "p")
-        self.pull_btn.setStyleSheet(technique_style)
+        self.pull_btn.setStyleSheet(_TECH_BTN_QSS)
         self.pull_btn.setFixedWidth(80)
         
         technique_layout.addWidget(self.slide_btn)
@@ -369,24 +721,9 @@ class LickEditor(QWidget):
         # Measure navigation
         nav_layout = QHBoxLayout()
         
-        # Style for navigation buttons
-        nav_btn_style = """
-            QPushButton {
-                background-color: #27AE60;
-                color: white;
-                border-radius: 5px;
-                padding: 8px;
-            }
-            QPushButton:hover {
-                background-color: #229954;
-            }
-            QPushButton:pressed {
-                background-color: #1E8449;
-            }
-        """
         
         self.prev_btn = QPushButton("← Previous Measure")
-        self.prev_btn.setStyleSheet(nav_btn_style)
+        self.prev_btn.setStyleSheet(_NAV_BTN_QSS)
         self.prev_btn.clicked.connect(self.previous_measure)
         
         self.measure_label = QLabel("Measure 1/1")
@@ -394,11 +731,11 @@ class LickEditor(QWidget):
         self.measure_label.setStyleSheet("font-weight: bold; color: #2C3E50;")
         
         self.next_btn = QPushButton("Next Measure →")
-        self.next_btn.setStyleSheet(nav_btn_style)
+        self.next_btn.setStyleSheet(_NAV_BTN_QSS)
         self.next_btn.clicked.connect(self.next_measure)
         
         self.add_measure_btn = QPushButton("+ Add Measure")
-        self.add_measure_btn.setStyleSheet(nav_btn_style)
+        self.add_measure_btn.setStyleSheet(_NAV_BTN_QSS)
         self.add_measure_btn.clicked.connect(self.add_measure)
         
         nav_layout.addWidget(self.prev_btn)
@@ -413,42 +750,14 @@ class LickEditor(QWidget):
         # Save button
         self.save_btn = QPushButton("Save Lick")
         self.save_btn.setMinimumHeight(40)
-        self.save_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #9B59B6;
-                color: white;
-                border-radius: 5px;
-                font-weight: bold;
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background-color: #8E44AD;
-            }
-            QPushButton:pressed {
-                background-color: #7D3C98;
-            }
-        """)
+        self.save_btn.setStyleSheet(_SAVE_QSS)
         self.save_btn.clicked.connect(self.save_lick)
         button_layout.addWidget(self.save_btn)
         
         # Delete button
         self.delete_btn = QPushButton("Delete Lick")
         self.delete_btn.setMinimumHeight(40)
-        self.delete_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #E74C3C;
-                color: white;
-                border-radius: 5px;
-                font-weight: bold;
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background-color: #C0392B;
-            }
-            QPushButton:pressed {
-                background-color: #922B21;
-            }
-        """)
+        self.delete_btn.setStyleSheet(_DELETE_QSS)
         self.delete_btn.clicked.connect(self.delete_lick)
         button_layout.addWidget(self.delete_btn)
         
@@ -462,9 +771,8 @@ class LickEditor(QWidget):
         self.title_label.setText(lick_data.get("name", "Untitled Lick"))
         
         # Load measures
-        self.fretboard.measures = lick_data.get("measures", [{"notes": []}])
-        if not self.fretboard.measures:
-            self.fretboard.measures = [{"notes": []}]
+        measures = lick_data.get("measures") or [{"notes": []}]
+        self.fretboard.measures = [self._migrate_measure(m) for m in measures]
         
         # Reset to first measure
         self.fretboard.current_measure = 0
@@ -475,38 +783,42 @@ class LickEditor(QWidget):
     
     def update_measure_label(self):
         """Update the measure number display"""
-        current = self.fretboard.current_measure + 1
-        total = len(self.fretboard.measures)
-        self.measure_label.setText(f"Measure {current}/{total}")
+        fb = self.fretboard
+        current = fb.current_measure + 1
+        total = len(fb.measures)
+        text = f"Measure {current}/{total}"
+        if text != self._last_measure_label:
+            self.measure_label.setText(text)
+            self._last_measure_label = text
     
     def previous_measure(self):
         """Navigate to the previous measure"""
-        if self.fretboard.current_measure > 0:
-            self.fretboard.load_measure(self.fretboard.current_measure - 1)
+        fb = self.fretboard
+        idx = fb.current_measure
+        if idx > 0:
+            fb.load_measure(idx - 1)
             self.update_measure_label()
     
     def next_measure(self):
         """Navigate to the next measure"""
-        if self.fretboard.current_measure < len(self.fretboard.measures) - 1:
-            self.fretboard.load_measure(self.fretboard.current_measure + 1)
+        fb = self.fretboard
+        idx = fb.current_measure
+        if idx < len(fb.measures) - 1:
+            fb.load_measure(idx + 1)
             self.update_measure_label()
     
     def add_measure(self):
         """Add a new measure after the current one"""
-        current_idx = self.fretboard.current_measure
-        self.fretboard.measures.insert(current_idx + 1, {"notes": []})
-        self.fretboard.load_measure(current_idx + 1)
+        fb = self.fretboard
+        current_idx = fb.current_measure
+        fb.measures.insert(current_idx + 1, {"notes": {}})
+        fb.load_measure(current_idx + 1)
         self.update_measure_label()
     
     def save_lick(self):
         """Signal to save the current lick data"""
-        # Prepare the current lick data
-        current_data = {
-            "name": self.title_label.text(),
-            "measures": self.fretboard.measures
-        }
         # Emit the signal with the current data
-        self.save_requested.emit(current_data)
+        self.save_requested.emit(self.get_lick_data())
     
     def delete_lick(self):
         """Signal to delete the current lick"""
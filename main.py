@@ -1,12 +1,169 @@
 import os
 import sys
+import stat
+from collections import OrderedDict
 from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTreeView, QFileSystemModel, QLabel, QSplitter, QMessageBox
-from PyQt5.QtCore import Qt, QDir
+from PyQt5.QtCore import Qt, QDir, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt5.QtGui import QIcon, QFont
-import json
 
 from lick_editor import LickEditor
-from create_lick_dialog import CreateLickDialog
+from create_lick_dialog import CreateLickDialog, NameOnlyFileSystemModel, SharedIconProvider
+
+# Main window stylesheets, built once at import rather than per window
+_MAIN_QSS = """
+    QMainWindow {
+        background-color: #ECECEC;
+    }
+    QTreeView {
+        background-color: #F5F5F5;
+        border-radius: 5px;
+        padding: 5px;
+        selection-background-color: #3498DB;
+        font-size: 12px;
+    }
+    QSplitter::handle {
+        background-color: #CCCCCC;
+    }
+    QLabel {
+        color: #2C3E50;
+    }
+"""
+
+_CREATE_BTN_QSS = """
+    QPushButton {
+        background-color: #3498DB;
+        color: white;
+        border-radius: 5px;
+        font-weight: bold;
+        padding: 10px;
+    }
+    QPushButton:hover {
+        background-color: #2980B9;
+    }
+    QPushButton:pressed {
+        background-color: #1F618D;
+    }
+"""
+
+# Number of parsed lick files kept in memory for quick re-selection
+_LICK_CACHE_SIZE = 64
+
+# Lick file suffix; the library model's *.lick filter matches it case-insensitively
+_LICK_EXT = ".lick"
+
+# Write indented .lick files for hand inspection; compact JSON otherwise
+_PRETTY_LICK_FILES = bool(os.environ.get("LICKHOUSE_PRETTY_JSON"))
+
+# json, orjson and copy are only needed once a lick is opened or saved, so
+# they are imported on first use rather than before the window appears
+_orjson = False  # Not imported yet; None once known to be missing
+
+def _get_orjson():
+    """Return the optional orjson module (faster .lick parsing and writing), or None"""
+    global _orjson
+    if _orjson is False:
+        try:
+            import orjson as _orjson
+        except ImportError:
+            _orjson = None
+    return _orjson
+
+def read_lick_file(path):
+    """Parse a .lick file, using orjson when it is installed"""
+    with open(path, 'rb') as file:
+        content = file.read()
+    if not content.strip():
+        raise ValueError("File is empty")
+    orjson = _get_orjson()
+    if orjson is not None:
+        return orjson.loads(content)
+    import json
+    return json.loads(content)
+
+def read_lick_file_if_changed(path, signature):
+    """Return (signature, data) for a .lick file, with data None when signature still matches"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
+        raise FileNotFoundError(f"File not found: {path}")
+    
+    current = (st.st_mtime_ns, st.st_size)
+    if current == signature:
+        return current, None
+    return current, read_lick_file(path)
+
+def write_lick_file(path, lick_data):
+    """Atomically write lick data as compact JSON, using orjson when it is installed"""
+    orjson = _get_orjson()
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if _PRETTY_LICK_FILES else 0
+        payload = orjson.dumps(lick_data, option=option)
+    else:
+        import json
+        if _PRETTY_LICK_FILES:
+            payload = json.dumps(lick_data, indent=2).encode('utf-8')
+        else:
+            payload = json.dumps(lick_data, separators=(',', ':')).encode('utf-8')
+    
+    # Save through symlinks to the real lick, keeping its permissions
+    target = os.path.realpath(path)
+    try:
+        mode = stat.S_IMODE(os.stat(target).st_mode)
+    except FileNotFoundError:
+        mode = None  # New lick: the umask applies, as with open()
+    
+    # Write to a uniquely named file beside the target and rename it over, so
+    # readers and sync clients never see a half-written lick and overlapping
+    # writes never share a temp file; *.tmp is hidden by the library filter
+    directory, name = os.path.split(target)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+    while True:
+        tmp_path = os.path.join(directory, f"{name}.{os.urandom(4).hex()}.tmp")
+        try:
+            fd = os.open(tmp_path, flags, 0o666)
+            break
+        except FileExistsError:
+            continue
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(payload)
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, target)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+class LickFileWorkerSignals(QObject):
+    """Signals emitted by LickFileWorker back on the GUI thread"""
+    result = pyqtSignal(str, object)
+    finished = pyqtSignal(str)
+    failed = pyqtSignal(str, object)
+
+
+class LickFileWorker(QRunnable):
+    """Run a blocking lick file operation on a pool thread"""
+    def __init__(self, path, operation, *args):
+        super().__init__()
+        self.path = path
+        self.operation = operation
+        self.args = args
+        self.signals = LickFileWorkerSignals()
+    
+    def run(self):
+        try:
+            value = self.operation(self.path, *self.args)
+        except Exception as e:
+            self.signals.failed.emit(self.path, e)
+        else:
+            self.signals.result.emit(self.path, value)
+            self.signals.finished.emit(self.path)
+
 
 class LickHouseApp(QMainWindow):
     def __init__(self):
@@ -15,24 +172,7 @@ class LickHouseApp(QMainWindow):
         self.setGeometry(100, 100, 1200, 800)
         
         # Set app style
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #ECECEC;
-            }
-            QTreeView {
-                background-color: #F5F5F5;
-                border-radius: 5px;
-                padding: 5px;
-                selection-background-color: #3498DB;
-                font-size: 12px;
-            }
-            QSplitter::handle {
-                background-color: #CCCCCC;
-            }
-            QLabel {
-                color: #2C3E50;
-            }
-        """)
+        self.setStyleSheet(_MAIN_QSS)
         
         # Set up data directory
         self.base_dir = os.path.join(os.path.expanduser("~"), "LickHouse")
@@ -63,30 +203,26 @@ class LickHouseApp(QMainWindow):
         # Folder view
         self.folder_view = QTreeView()
         self.folder_view.setMinimumWidth(250)
-        self.file_model = QFileSystemModel()
-        self.file_model.setRootPath(self.base_dir)
+        self.file_model = NameOnlyFileSystemModel()  # Size, type and date are never shown
+        
+        # Keep watching for new and saved licks, but skip symlink resolution
+        # and custom folder icon lookups, which are slow on synced folders
+        self.file_model.setOption(QFileSystemModel.DontResolveSymlinks, True)
+        self._icon_provider = SharedIconProvider()  # Model does not take ownership
+        self.file_model.setIconProvider(self._icon_provider)
         
         # Configure model to show directories and .lick files
         self.file_model.setFilter(QDir.AllDirs | QDir.Files | QDir.NoDotAndDotDot)
-        self.file_model.setNameFilters(["*.lick"])  # Only filter files, not directories
+        self.file_model.setNameFilters(["*" + _LICK_EXT])  # Only filter files, not directories
         self.file_model.setNameFilterDisables(False)
         
-        # Set up the view
-        self.folder_view.setModel(self.file_model)
-        self.folder_view.setRootIndex(self.file_model.index(self.base_dir))
+        # Set up the view; the model is attached once the window has painted
         self.folder_view.clicked.connect(self.on_file_selected)
-        self.folder_view.setColumnWidth(0, 200)
         self.folder_view.setHeaderHidden(True)
-        self.folder_view.hideColumn(1)  # Size column
-        self.folder_view.hideColumn(2)  # Type column
-        self.folder_view.hideColumn(3)  # Date modified column
         self.folder_view.setAnimated(True)  # Enable animations for expanding/collapsing
         self.folder_view.setIndentation(20)  # Set indentation for better visual hierarchy
-        
-        # Force refresh of the view
-        self.file_model.setRootPath(self.base_dir)
-        self.folder_view.expandAll()  # Expand all folders by default
         left_layout.addWidget(self.folder_view)
+        QTimer.singleShot(0, self._finish_tree_init)
         
         splitter.addWidget(left_panel)
         
@@ -98,21 +234,7 @@ class LickHouseApp(QMainWindow):
         # Create lick button
         create_button = QPushButton("Create New Lick")
         create_button.setMinimumHeight(40)
-        create_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3498DB;
-                color: white;
-                border-radius: 5px;
-                font-weight: bold;
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background-color: #2980B9;
-            }
-            QPushButton:pressed {
-                background-color: #1F618D;
-            }
-        """)
+        create_button.setStyleSheet(_CREATE_BTN_QSS)
         create_button.clicked.connect(self.create_new_lick)
         right_layout.addWidget(create_button)
         
@@ -130,17 +252,59 @@ class LickHouseApp(QMainWindow):
         splitter.setSizes([250, 950])
         
         self.current_lick_path = None
+        self._pending_lick_path = None  # Selected lick whose read is still in flight
+        self._pending_select_path = None  # Created lick to select once its folder is listed
+        
+        # Parsed lick files by path, as (mtime_ns, size, data), least recently used first
+        self._lick_cache = OrderedDict()
+        
+        # Saves and deletes run one at a time, in the order they were requested,
+        # so repeated saves never overlap and a delete never races a save
+        self._file_pool = QThreadPool(self)
+        self._file_pool.setMaxThreadCount(1)
 
+    def _finish_tree_init(self):
+        """Root the file model and attach it to the tree after the first paint"""
+        self.file_model.setRootPath(self.base_dir)
+        self.folder_view.setModel(self.file_model)
+        self.folder_view.setRootIndex(self.file_model.index(self.base_dir))
+        self.folder_view.setColumnWidth(0, 200)
+        
+        # Expand the top-level folders once they are listed, without walking the whole tree
+        self.file_model.directoryLoaded.connect(self._expand_top_level)
+        self.file_model.directoryLoaded.connect(self._select_created_lick)
+    
+    def _expand_top_level(self, path):
+        """Expand the direct children of the library root the first time it loads"""
+        root_index = self.folder_view.rootIndex()
+        if self.file_model.index(path) != root_index:
+            return
+        self.file_model.directoryLoaded.disconnect(self._expand_top_level)
+        for row in range(self.file_model.rowCount(root_index)):
+            self.folder_view.expand(self.file_model.index(row, 0, root_index))
+    
+    def _select_created_lick(self, path):
+        """Select a newly created lick once the model has listed its folder"""
+        pending = self._pending_select_path
+        if pending is None or QDir.cleanPath(path) != QDir.cleanPath(os.path.dirname(pending)):
+            return
+        index = self.file_model.index(pending)
+        if index.isValid():
+            self._pending_select_path = None
+            self.folder_view.setCurrentIndex(index)
+    
     def init_directory_structure(self):
         """Initialize the default directory structure if it doesn't exist"""
-        if not os.path.exists(self.base_dir):
-            os.makedirs(self.base_dir)
+        os.makedirs(self.base_dir, exist_ok=True)
+        
+        # One directory listing instead of a stat per default folder
+        with os.scandir(self.base_dir) as entries:
+            existing = {entry.name for entry in entries}
             
         default_folders = ["E Licks", "A Licks", "D Licks", "G Licks", "B Licks", "F Licks", "C Licks"]
         for folder in default_folders:
-            folder_path = os.path.join(self.base_dir, folder)
-            if not os.path.exists(folder_path):
-                os.makedirs(folder_path)
+            if folder not in existing:
+                os.makedirs(os.path.join(self.base_dir, folder), exist_ok=True)
     
     def on_file_selected(self, index):
         """Handle file selection in the tree view"""
@@ -149,52 +313,106 @@ class LickHouseApp(QMainWindow):
             if not path:
                 return
                 
-            # Check if it's a file and has .lick extension
-            if os.path.isfile(path) and path.lower().endswith('.lick'):
-                self.current_lick_path = path
-                self.load_lick(path)
+            # Check if it's a file and has .lick extension; the model already
+            # knows the entry type, and _read_lick stats the file once anyway
+            if not self.file_model.isDir(index) and path[-len(_LICK_EXT):].lower() == _LICK_EXT:
+                # The editor keeps the previous lick (and path) until the read lands
+                self._pending_lick_path = path
+                self._load_lick_async(path)
             else:
+                self._pending_lick_path = None
                 self.current_lick_path = None
         except Exception as e:
             print(f"Error in file selection: {str(e)}")  # Debug print
+            self._pending_lick_path = None
             self.current_lick_path = None
     
+    def _lick_signature(self, path):
+        """Return the (mtime_ns, size) the cached copy of path was read at, if any"""
+        cached = self._lick_cache.get(path)
+        return cached[:2] if cached is not None else None
+    
+    def _cache_lick(self, path, signature, lick_data):
+        """Store freshly read lick data, or reuse the cached copy when lick_data is None"""
+        if lick_data is None:
+            lick_data = self._lick_cache[path][2]
+        self._lick_cache[path] = (*signature, lick_data)
+        self._lick_cache.move_to_end(path)
+        if len(self._lick_cache) > _LICK_CACHE_SIZE:
+            self._lick_cache.popitem(last=False)
+        
+        # The editor and the defaults below mutate what they are given
+        import copy
+        return copy.deepcopy(lick_data)
+    
+    def _read_lick(self, path):
+        """Return a copy of the parsed lick file, re-reading it only when it changed on disk"""
+        signature, lick_data = read_lick_file_if_changed(path, self._lick_signature(path))
+        return self._cache_lick(path, signature, lick_data)
+    
+    def _show_lick(self, path, lick_data):
+        """Load parsed lick data into the editor"""
+        if not isinstance(lick_data, dict):
+            raise ValueError("Invalid lick data format")
+            
+        # Ensure required fields exist
+        if "name" not in lick_data:
+            lick_data["name"] = os.path.splitext(os.path.basename(path))[0]
+        if "measures" not in lick_data:
+            lick_data["measures"] = [{"notes": []}]
+            
+        # Load into editor
+        self.lick_editor.load_lick(lick_data)
+        self.current_lick_path = path
+    
+    def _report_load_error(self, error):
+        """Warn about a lick that could not be loaded and drop the selection"""
+        import json  # orjson.JSONDecodeError subclasses json's
+        if isinstance(error, json.JSONDecodeError):
+            print(f"JSON decode error: {str(error)}")  # Debug print
+            QMessageBox.warning(self, "Error Loading Lick", f"Invalid JSON format in lick file: {str(error)}")
+        elif isinstance(error, FileNotFoundError):
+            print(f"File not found: {str(error)}")  # Debug print
+            QMessageBox.warning(self, "Error Loading Lick", str(error))
+        else:
+            print(f"General error: {str(error)}")  # Debug print
+            QMessageBox.warning(self, "Error Loading Lick", f"Could not load lick file: {str(error)}")
+        self.current_lick_path = None
+    
     def load_lick(self, path):
         """Load lick data from file into the editor"""
         try:
-            if not os.path.isfile(path):
-                raise FileNotFoundError(f"File not found: {path}")
-                
-            with open(path, 'r', encoding='utf-8') as file:
-                content = file.read()
-                if not content.strip():
-                    raise ValueError("File is empty")
-                    
-                lick_data = json.loads(content)
-                if not isinstance(lick_data, dict):
-                    raise ValueError("Invalid lick data format")
-                    
-                # Ensure required fields exist
-                if "name" not in lick_data:
-                    lick_data["name"] = os.path.splitext(os.path.basename(path))[0]
-                if "measures" not in lick_data:
-                    lick_data["measures"] = [{"notes": []}]
-                    
-                # Load into editor
-                self.lick_editor.load_lick(lick_data)
-                
-        except json.JSONDecodeError as e:
-            print(f"JSON decode error: {str(e)}")  # Debug print
-            QMessageBox.warning(self, "Error Loading Lick", f"Invalid JSON format in lick file: {str(e)}")
-            self.current_lick_path = None
-        except FileNotFoundError as e:
-            print(f"File not found: {str(e)}")  # Debug print
-            QMessageBox.warning(self, "Error Loading Lick", str(e))
-            self.current_lick_path = None
+            self._show_lick(path, self._read_lick(path))
         except Exception as e:
-            print(f"General error: {str(e)}")  # Debug print
-            QMessageBox.warning(self, "Error Loading Lick", f"Could not load lick file: {str(e)}")
-            self.current_lick_path = None
+            self._report_load_error(e)
+    
+    def _load_lick_async(self, path):
+        """Read a lick on a pool thread so slow disks don't block the UI"""
+        worker = LickFileWorker(path, read_lick_file_if_changed, self._lick_signature(path))
+        worker.signals.result.connect(self.on_lick_read)
+        worker.signals.failed.connect(self.on_lick_read_failed)
+        QThreadPool.globalInstance().start(worker)
+    
+    def on_lick_read(self, path, result):
+        """Show a lick the worker has read, unless another one was selected since"""
+        if path != self._pending_lick_path:
+            return
+        if result[1] is None and path not in self._lick_cache:
+            # Evicted or deleted while the read was in flight; read it again
+            self._load_lick_async(path)
+            return
+        self._pending_lick_path = None
+        try:
+            self._show_lick(path, self._cache_lick(path, *result))
+        except Exception as e:
+            self._report_load_error(e)
+    
+    def on_lick_read_failed(self, path, error):
+        """Report a lick the worker could not read, unless another one was selected since"""
+        if path != self._pending_lick_path:
+            return
+        self._pending_lick_path = None
+        self._report_load_error(error)
     
     def save_current_lick(self):
         """Save the current lick to file"""
@@ -202,20 +420,22 @@ class LickHouseApp(QMainWindow):
             QMessageBox.information(self, "No Lick Selected", "Please create a new lick or select an existing one to save.")
             return
         
-        try:
-            # Get data from editor
-            lick_data = {
-                "name": self.lick_editor.title_label.text(),
-                "measures": self.lick_editor.fretboard.measures
-            }
-            
-            # Save to file
-            with open(self.current_lick_path, 'w', encoding='utf-8') as file:
-                json.dump(lick_data, file, indent=4)
-                
-            QMessageBox.information(self, "Lick Saved", f"Lick saved successfully to {os.path.basename(self.current_lick_path)}.")
-        except Exception as e:
-            QMessageBox.warning(self, "Error Saving Lick", f"Could not save lick file: {str(e)}")
+        # Get data from editor, then write it on the file thread
+        lick_data = self.lick_editor.get_lick_data()
+        worker = LickFileWorker(self.current_lick_path, write_lick_file, lick_data)
+        worker.signals.finished.connect(self.on_lick_saved)
+        worker.signals.failed.connect(self.on_lick_save_failed)
+        self._file_pool.start(worker)
+    
+    def on_lick_saved(self, path):
+        """Report a lick the worker has written"""
+        # Coarse mtimes can leave a same-size rewrite with the old signature
+        self._lick_cache.pop(path, None)
+        QMessageBox.information(self, "Lick Saved", f"Lick saved successfully to {os.path.basename(path)}.")
+    
+    def on_lick_save_failed(self, path, error):
+        """Report a lick the worker could not write"""
+        QMessageBox.warning(self, "Error Saving Lick", f"Could not save lick file: {str(error)}")
     
     def delete_current_lick(self):
         """Delete the current lick"""
@@ -223,27 +443,41 @@ class LickHouseApp(QMainWindow):
             QMessageBox.information(self, "No Lick Selected", "Please select a lick to delete.")
             return
             
-        if not os.path.exists(self.current_lick_path):
-            QMessageBox.warning(self, "Error", "Selected file no longer exists.")
-            self.current_lick_path = None
-            return
-            
+        # A lick that has vanished is reported by the worker's os.remove
         reply = QMessageBox.question(self, "Confirm Delete", 
             f"Are you sure you want to delete '{os.path.basename(self.current_lick_path)}'?",
             QMessageBox.Yes | QMessageBox.No)
             
         if reply == QMessageBox.Yes:
-            try:
-                os.remove(self.current_lick_path)
-                self.current_lick_path = None
-                self.lick_editor.load_lick({"name": "New Lick", "measures": [{"notes": []}]})
-                QMessageBox.information(self, "Success", "Lick deleted successfully.")
-            except PermissionError:
-                QMessageBox.warning(self, "Error", "Permission denied. Cannot delete the file.")
-            except Exception as e:
-                QMessageBox.warning(self, "Error Deleting Lick", f"Could not delete lick file: {str(e)}")
+            worker = LickFileWorker(self.current_lick_path, os.remove)
+            worker.signals.finished.connect(self.on_lick_deleted)
+            worker.signals.failed.connect(self.on_lick_delete_failed)
+            self._file_pool.start(worker)
+    
+    def _reset_if_current(self, path):
+        """Clear the editor if path is still the lick being edited"""
+        if self.current_lick_path == path:
+            self.current_lick_path = None
+            self.lick_editor.load_lick({"name": "New Lick", "measures": [{"notes": []}]})
+    
+    def on_lick_deleted(self, path):
+        """Clear the editor once the worker has removed the lick"""
+        self._lick_cache.pop(path, None)
+        self._reset_if_current(path)
+        QMessageBox.information(self, "Success", "Lick deleted successfully.")
+    
+    def on_lick_delete_failed(self, path, error):
+        """Report a lick the worker could not remove"""
+        if isinstance(error, FileNotFoundError):
+            self._lick_cache.pop(path, None)
+            if self.current_lick_path == path:
                 self.current_lick_path = None
-                self.lick_editor.load_lick({"name": "New Lick", "measures": [{"notes": []}]})
+            QMessageBox.warning(self, "Error", "Selected file no longer exists.")
+        elif isinstance(error, PermissionError):
+            QMessageBox.warning(self, "Error", "Permission denied. Cannot delete the file.")
+        else:
+            QMessageBox.warning(self, "Error Deleting Lick", f"Could not delete lick file: {str(error)}")
+            self._reset_if_current(path)
     
     def create_new_lick(self):
         """Open dialog to create a new lick"""
@@ -275,15 +509,21 @@ class LickHouseApp(QMainWindow):
                 os.makedirs(os.path.dirname(lick_path), exist_ok=True)
                 
                 # Save the file
-                with open(lick_path, 'w', encoding='utf-8') as file:
-                    json.dump(empty_lick, file, indent=4)
+                write_lick_file(lick_path, empty_lick)
                 
                 # Open the new lick in the editor
+                self._pending_lick_path = None
                 self.current_lick_path = lick_path
                 self.lick_editor.load_lick(empty_lick)
                 
-                # Update the file view to show the new file
-                self.folder_view.setCurrentIndex(self.file_model.index(lick_path))
+                # Select the new file once the model picks it up, rather than
+                # resolving it synchronously before the folder has been re-listed.
+                # The rename in write_lick_file always wakes the folder's watcher;
+                # folders never opened are listed on demand
+                self._pending_select_path = lick_path
+                parent_index = self.file_model.index(os.path.dirname(lick_path))
+                if self.file_model.canFetchMore(parent_index):
+                    self.file_model.fetchMore(parent_index)
                 
                 QMessageBox.information(self, "Success", f"New lick '{lick_name}' created successfully.")
             except Exception as e: